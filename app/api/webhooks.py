@@ -1,7 +1,12 @@
 import hmac
 import hashlib
 import logging
+import operator
+from typing import Any, Dict, Tuple
 from fastapi import APIRouter, Request, Depends, HTTPException, Header, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
 from app.config import settings
 from app.models.schemas import WebhookPayload, WebhookResponse
 from app.services.zoho import ZohoService
@@ -17,45 +22,122 @@ router = APIRouter()
 zoho_service = ZohoService()
 supabase_service = SupabaseService()
 
+# XOR tables for the HMAC inner and outer key pads
+_HMAC_IPAD = bytes(x ^ 0x36 for x in range(256))
+_HMAC_OPAD = bytes(x ^ 0x5C for x in range(256))
+
+def _hmac_sha256_contexts(key: bytes) -> Tuple[Any, Any]:
+    """
+    Build the inner and outer SHA-256 contexts of an HMAC key (RFC 2104).
+    
+    The webhook secret never changes, so the padded key blocks are hashed
+    once here and each request only copies the contexts.
+    """
+    block_size = hashlib.sha256().block_size
+    if len(key) > block_size:
+        key = hashlib.sha256(key).digest()
+    key = key.ljust(block_size, b"\0")
+    
+    inner = hashlib.sha256(key.translate(_HMAC_IPAD))
+    outer = hashlib.sha256(key.translate(_HMAC_OPAD))
+    return inner, outer
+
+# Webhook secret key schedule, computed once instead of on every request
+_WEBHOOK_INNER, _WEBHOOK_OUTER = _hmac_sha256_contexts(
+    settings.ZOHO_WEBHOOK_SECRET.encode()
+)
+
+def _webhook_digest(body: bytes) -> bytes:
+    """Compute the HMAC-SHA256 of a webhook body with the webhook secret."""
+    inner = _WEBHOOK_INNER.copy()
+    inner.update(body)
+    outer = _WEBHOOK_OUTER.copy()
+    outer.update(inner.digest())
+    return outer.digest()
+
 async def verify_webhook_signature(
     request: Request,
     x_zoho_signature: str = Header(..., description="Webhook signature from Zoho")
-) -> bool:
-    """Verify the webhook signature from Zoho CRM."""
+) -> bytes:
+    """
+    Verify the webhook signature from Zoho CRM.
+    
+    Returns the raw request body so it can be decoded without reading it again.
+    """
     body = await request.body()
     
     # Create expected signature using the webhook secret
-    secret = settings.ZOHO_WEBHOOK_SECRET.encode()
-    expected_signature = hmac.new(
-        secret,
-        body,
-        hashlib.sha256
-    ).hexdigest()
+    expected_signature = _webhook_digest(body)
     
-    # Compare signatures
-    if not hmac.compare_digest(expected_signature, x_zoho_signature):
+    # Compare raw digests rather than their hex encodings
+    try:
+        signature = bytes.fromhex(x_zoho_signature)
+    except ValueError:
+        signature = b""
+    
+    if not hmac.compare_digest(expected_signature, signature):
         logger.warning("Invalid webhook signature")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid webhook signature"
         )
     
-    return True
+    return body
+
+def _inline_schema(model: Any) -> Dict[str, Any]:
+    """
+    Get a model's JSON schema with its $defs references inlined.
+    
+    Schemas passed through openapi_extra are embedded as-is, so local
+    "#/$defs/..." references would otherwise point at the document root.
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+    
+    def resolve(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref", "")
+            if ref.startswith("#/$defs/"):
+                return resolve(defs[ref[len("#/$defs/"):]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+    
+    return resolve(schema)
 
-@router.post("/zoho", response_model=WebhookResponse)
+@router.post(
+    "/zoho",
+    responses={200: {"model": WebhookResponse}},
+    # The body is decoded by hand after signature verification, so declare it here
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": _inline_schema(WebhookPayload)}},
+            "required": True,
+        }
+    },
+)
 async def handle_zoho_webhook(
-    payload: WebhookPayload,
-    verified: bool = Depends(verify_webhook_signature)
+    body: bytes = Depends(verify_webhook_signature)
 ):
     """
     Handle webhooks from Zoho CRM.
     
     This endpoint receives notifications from Zoho CRM when records are
     created, updated, or deleted. The data is then synchronized with Supabase.
+    The payload is only decoded once its signature has been verified.
     """
+    try:
+        payload = WebhookPayload.model_validate_json(body)
+    except ValidationError as e:
+        # Report errors against the body, as FastAPI does for declared models
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])} for error in e.errors()
+        ])
+    
     try:
         # Log the webhook payload
-        logger.info(f"Received webhook: {payload.operation} - {payload.resource}")
+        logger.info("Received webhook: %s - %s", payload.operation, payload.resource)
         
         # Process the webhook data
         processed_data = await zoho_service.process_webhook(payload)
@@ -66,20 +148,56 @@ async def handle_zoho_webhook(
             data=processed_data
         )
         
-        # Respond to Zoho CRM
-        return WebhookResponse(
-            status="success",
-            message=f"Processed {payload.operation} for {payload.resource}",
-            data={"id": result.get("id", None)}
-        )
+        # Respond to Zoho CRM; the shape is fixed, so skip response model validation
+        return ORJSONResponse({
+            "status": "success",
+            "message": f"Processed {payload.operation} for {payload.resource}",
+            "data": {"id": result.get("id", None)}
+        })
         
     except Exception as e:
-        logger.error(f"Error processing webhook: {str(e)}")
+        logger.error("Error processing webhook: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing webhook: {str(e)}"
         )
 
+# Zoho lead fields to fetch, and the keys they are returned under
+_LEAD_FIELDS = (
+    "id",
+    "First_Name",
+    "Last_Name",
+    "Lead_Status",
+    "Lead_Source",
+    "Cold_lead_intro",
+    "Brand",
+    "Created_Time",
+    "Creation_date",
+    "Contact_type",
+)
+_LEAD_OUTPUT_FIELDS = (
+    "lead_id",
+    "first_name",
+    "last_name",
+    "lead_status",
+    "lead_source",
+    "cold_lead_intro",
+    "brand",
+    "created_time",
+    "creation_date",
+    "contact_type",
+)
+_get_lead_fields = operator.itemgetter(*_LEAD_FIELDS)
+
+def _format_lead(lead: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a Zoho lead record to the response format."""
+    try:
+        values = _get_lead_fields(lead)
+    except KeyError:
+        # Zoho omits fields it has no value for
+        values = map(lead.get, _LEAD_FIELDS)
+    return dict(zip(_LEAD_OUTPUT_FIELDS, values))
+
 @router.get("/leads")
 async def get_leads(
     page: int = 1, 
@@ -92,44 +210,16 @@ async def get_leads(
     This endpoint fetches leads from Zoho CRM with only the specified fields.
     """
     try:
-        # Define the fields to fetch
-        fields = [
-            "id", 
-            "First_Name", 
-            "Last_Name", 
-            "Lead_Status",
-            "Lead_Source",
-            "Cold_lead_intro",
-            "Brand",
-            "Created_Time",
-            "Creation_date",
-            "Contact_type"
-        ]
-        
         # Get leads from Zoho CRM
         leads = await zoho_service.get_leads(
-            fields=fields,
+            fields=list(_LEAD_FIELDS),
             criteria=criteria,
             page=page,
             per_page=per_page
         )
         
         # Transform the data to match the required format
-        formatted_leads = []
-        for lead in leads:
-            formatted_lead = {
-                "lead_id": lead.get("id"),
-                "first_name": lead.get("First_Name"),
-                "last_name": lead.get("Last_Name"),
-                "lead_status": lead.get("Lead_Status"),
-                "lead_source": lead.get("Lead_Source"),
-                "cold_lead_intro": lead.get("Cold_lead_intro"),
-                "brand": lead.get("Brand"),
-                "created_time": lead.get("Created_Time"),
-                "creation_date": lead.get("Creation_date"),
-                "contact_type": lead.get("Contact_type")
-            }
-            formatted_leads.append(formatted_lead)
+        formatted_leads = [_format_lead(lead) for lead in leads]
         
         return {
             "status": "success",
@@ -138,7 +228,7 @@ async def get_leads(
         }
         
     except Exception as e:
-        logger.error(f"Error fetching leads: {str(e)}")
+        logger.error("Error fetching leads: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error fetching leads: {str(e)}"
@@ -1,6 +1,6 @@
 import os
 from typing import Optional
-from pydantic import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -12,6 +12,8 @@ class Settings(BaseSettings):
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
     PORT: int = int(os.getenv("PORT", "8000"))
     HOST: str = os.getenv("HOST", "0.0.0.0")
+    # Each worker refreshes its own Zoho access token, so scale out deliberately
+    WORKERS: int = int(os.getenv("WORKERS", "1"))
     PROJECT_NAME: str = "Zoho CRM to Supabase Integration"
     
     # Zoho CRM Configuration
@@ -29,9 +31,7 @@ class Settings(BaseSettings):
     # Logging Configuration
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
 # Create settings instance
 settings = Settings() 
\ No newline at end of file
@@ -1,13 +1,18 @@
 import logging
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from app.config import settings
-from app.api.webhooks import router as webhook_router
+from app.api.webhooks import router as webhook_router, supabase_service, zoho_service
 
 # Configure logging
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
+# Log records don't include thread or process details, so skip collecting them
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logger = logging.getLogger(__name__)
 
 # Create FastAPI app
@@ -16,11 +21,35 @@ app = FastAPI(
     description="A webhook receiver that connects Zoho CRM to Supabase",
     version="0.1.0",
     debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
 )
 
 # Include routers
 app.include_router(webhook_router, prefix="/api/webhooks", tags=["webhooks"])
 
+@app.on_event("startup")
+async def startup():
+    """
+    Warm up the service clients.
+    
+    Creates the Supabase client and fetches a Zoho access token up front so
+    the first webhook doesn't pay for the connection setup.
+    """
+    try:
+        supabase_service.client
+    except Exception as e:
+        logger.warning("Could not create Supabase client at startup: %s", e)
+    
+    try:
+        await zoho_service.get_access_token()
+    except Exception as e:
+        logger.warning("Could not fetch Zoho access token at startup: %s", e)
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Release pooled HTTP connections held by the services."""
+    await zoho_service.aclose()
+
 @app.get("/", tags=["status"])
 async def root():
     """Root endpoint to check if the API is running."""
@@ -35,11 +64,17 @@ async def health():
 if __name__ == "__main__":
     import uvicorn
     
-    logger.info(f"Starting server on {settings.HOST}:{settings.PORT}")
+    logger.info("Starting server on %s:%s", settings.HOST, settings.PORT)
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
+        workers=settings.WORKERS,
+        # Picks uvloop and httptools when they're installed (not on Windows)
+        loop="auto",
+        http="auto",
+        # Webhook receipts are already logged by the handlers
+        access_log=False,
         log_level=settings.LOG_LEVEL.lower(),
     ) 
\ No newline at end of file
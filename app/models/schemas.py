@@ -1,6 +1,6 @@
 from typing import Dict, List, Any, Optional, Union
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class OperationType(str, Enum):
@@ -22,8 +22,7 @@ class WebhookPayload(BaseModel):
     data: List[Dict[str, Any]] = Field(..., description="The actual data payload")
     token: Optional[str] = None
     
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class WebhookResponse(BaseModel):
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from functools import cached_property
 from typing import Dict, List, Any, Optional, Union
 from supabase import create_client, Client
 from app.config import settings
@@ -13,18 +15,15 @@ class SupabaseService:
     def __init__(self):
         self.url = settings.SUPABASE_URL
         self.key = settings.SUPABASE_KEY
-        self._client = None
     
-    @property
+    @cached_property
     def client(self) -> Client:
         """
         Get Supabase client instance.
         
-        Creates a new client if one doesn't exist.
+        The client is created on first access and reused afterwards.
         """
-        if not self._client:
-            self._client = create_client(self.url, self.key)
-        return self._client
+        return create_client(self.url, self.key)
     
     async def store_data(
         self,
@@ -36,6 +35,7 @@ class SupabaseService:
         
         For single records, it uses upsert.
         For multiple records, it uses bulk upsert.
+        Records flagged as deleted are removed by ID alongside the upsert.
         """
         try:
             # Convert single record to list
@@ -43,39 +43,76 @@ class SupabaseService:
                 data = [data]
             
             if not data:
-                logger.warning(f"No data to store in {table}")
+                logger.warning("No data to store in %s", table)
                 return {"success": True, "data": None}
             
-            # Check if the data is for deletion
-            if "deleted" in data[0] and data[0].get("deleted") is True:
-                # This is a delete operation
-                record_ids = [item["id"] for item in data if "id" in item]
-                
-                if not record_ids:
-                    logger.warning("No IDs found for deletion")
-                    return {"success": True, "data": None}
-                
-                # Delete the records
-                response = self.client.table(table).delete().in_("id", record_ids).execute()
-                
-                return {
-                    "success": True,
-                    "data": {"deleted": len(record_ids)}
-                }
+            # Split the records into deletions and upserts in a single pass
+            record_ids = []
+            upserts = []
+            for item in data:
+                if item.get("deleted") is True:
+                    if "id" in item:
+                        record_ids.append(item["id"])
+                else:
+                    upserts.append(item)
             
-            # This is an insert or update operation
-            response = self.client.table(table).upsert(data).execute()
+            # A deletion wins over an upsert of the same record; the two run
+            # concurrently, so the upsert could otherwise restore the row
+            if record_ids and upserts:
+                deleted_ids = set(record_ids)
+                upserts = [item for item in upserts if item.get("id") not in deleted_ids]
             
-            # Parse response
-            if hasattr(response, "data"):
-                return {"success": True, "data": response.data}
-            else:
-                return {"success": True, "data": response}
+            if not record_ids and not upserts:
+                logger.warning("No IDs found for deletion")
+                return {"success": True, "data": None}
+            
+            # Run the delete and the upsert concurrently
+            deleted, upserted = await asyncio.gather(
+                self._delete_records(table, record_ids),
+                self._upsert_records(table, upserts)
+            )
+            
+            if not upserts:
+                return {"success": True, "data": {"deleted": deleted}}
+            if not record_ids:
+                return {"success": True, "data": upserted}
+            return {
+                "success": True,
+                "data": {"deleted": deleted, "upserted": upserted}
+            }
                 
         except Exception as e:
-            logger.error(f"Error storing data in Supabase: {str(e)}")
+            logger.error("Error storing data in Supabase: %s", e)
             return {"success": False, "error": str(e)}
     
+    async def _delete_records(self, table: str, record_ids: List[Any]) -> int:
+        """Delete records by ID and return how many were requested."""
+        if not record_ids:
+            return 0
+        
+        await asyncio.to_thread(
+            self.client.table(table).delete().in_("id", record_ids).execute
+        )
+        return len(record_ids)
+    
+    async def _upsert_records(
+        self,
+        table: str,
+        records: List[Dict[str, Any]]
+    ) -> Any:
+        """Upsert records and return the data from the response."""
+        if not records:
+            return None
+        
+        response = await asyncio.to_thread(
+            self.client.table(table).upsert(records).execute
+        )
+        
+        # Parse response
+        if hasattr(response, "data"):
+            return response.data
+        return response
+    
     async def query_data(
         self,
         table: str,
@@ -150,7 +187,7 @@ class SupabaseService:
                     query = query.offset(query_params["offset"])
             
             # Execute the query
-            response = query.execute()
+            response = await asyncio.to_thread(query.execute)
             
             # Parse response
             if hasattr(response, "data"):
@@ -159,5 +196,5 @@ class SupabaseService:
                 return response or []
                 
         except Exception as e:
-            logger.error(f"Error querying data from Supabase: {str(e)}")
+            logger.error("Error querying data from Supabase: %s", e)
             raise 
\ No newline at end of file
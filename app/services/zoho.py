@@ -1,6 +1,8 @@
 import time
+import asyncio
 import logging
-import requests
+import httpx
+import orjson
 from typing import Dict, List, Any, Optional
 from app.config import settings
 from app.models.schemas import WebhookPayload, ZohoToken
@@ -8,6 +10,9 @@ from app.models.schemas import WebhookPayload, ZohoToken
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Maximum number of record detail requests sent to Zoho at once
+MAX_CONCURRENT_FETCHES = 10
+
 class ZohoService:
     """Service for interacting with Zoho CRM API."""
     
@@ -19,47 +24,90 @@ class ZohoService:
         self.api_url = settings.ZOHO_API_URL
         self.access_token = None
         self.token_expiry = 0
+        # Shared async client so connections to Zoho are pooled across requests
+        self._client: Optional[httpx.AsyncClient] = None
+        # Serializes token refreshes so concurrent requests don't all refresh
+        self._refresh_lock = asyncio.Lock()
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client.
+        
+        Creates a new client if one doesn't exist, so the service can be
+        used again after aclose().
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=10.0, http2=True)
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        # A lock that was waited on is bound to this event loop; a restarted
+        # app runs on a new one
+        self._refresh_lock = asyncio.Lock()
     
-    async def get_access_token(self) -> str:
+    async def get_access_token(self, rejected_token: Optional[str] = None) -> str:
         """
         Get a valid access token for Zoho CRM API.
         
         If the current token is still valid, return it.
-        Otherwise, refresh the token.
+        Otherwise, refresh the token, letting only one caller refresh at a time.
+        
+        Args:
+            rejected_token: A token the API just refused; it is refreshed
+                unless another caller has already replaced it
         """
         # Check if token is still valid
-        current_time = int(time.time())
-        if self.access_token and current_time < self.token_expiry:
+        if self._token_is_valid(rejected_token):
             return self.access_token
         
-        # Token is expired or doesn't exist, refresh it
-        try:
-            logger.info("Refreshing Zoho access token")
-            response = requests.post(
-                f"{self.accounts_url}/oauth/v2/token",
-                params={
-                    "refresh_token": self.refresh_token,
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "grant_type": "refresh_token"
-                }
-            )
-            response.raise_for_status()
-            token_data = response.json()
+        # Only one refresh runs at a time; concurrent callers wait for it
+        async with self._refresh_lock:
+            # Another caller may have refreshed the token while we waited
+            if self._token_is_valid(rejected_token):
+                return self.access_token
             
-            # Parse token data
-            token = ZohoToken(**token_data)
-            
-            # Update token information
-            self.access_token = token.access_token
-            self.token_expiry = current_time + token.expires_in - 60  # Buffer of 60 seconds
-            
-            logger.info("Zoho access token refreshed successfully")
-            return self.access_token
-            
-        except Exception as e:
-            logger.error(f"Error refreshing Zoho access token: {str(e)}")
-            raise
+            # Token is expired or doesn't exist, refresh it
+            try:
+                logger.info("Refreshing Zoho access token")
+                current_time = int(time.time())
+                response = await self.client.post(
+                    f"{self.accounts_url}/oauth/v2/token",
+                    data={
+                        "refresh_token": self.refresh_token,
+                        "client_id": self.client_id,
+                        "client_secret": self.client_secret,
+                        "grant_type": "refresh_token"
+                    }
+                )
+                response.raise_for_status()
+                token_data = orjson.loads(response.content)
+                
+                # Parse token data
+                token = ZohoToken(**token_data)
+                
+                # Update token information
+                self.access_token = token.access_token
+                self.token_expiry = current_time + token.expires_in - 60  # Buffer of 60 seconds
+                
+                logger.info("Zoho access token refreshed successfully")
+                return self.access_token
+                
+            except Exception as e:
+                logger.error("Error refreshing Zoho access token: %s", e)
+                raise
+    
+    def _token_is_valid(self, rejected_token: Optional[str] = None) -> bool:
+        """Check whether the cached access token is usable and hasn't expired."""
+        return (
+            bool(self.access_token)
+            and self.access_token != rejected_token
+            and int(time.time()) < self.token_expiry
+        )
     
     async def make_api_request(
         self,
@@ -80,7 +128,7 @@ class ZohoService:
         
         # Make the request
         try:
-            response = requests.request(
+            response = await self.client.request(
                 method=method.upper(),
                 url=f"{self.api_url}/crm/v2/{endpoint}",
                 headers=headers,
@@ -88,19 +136,18 @@ class ZohoService:
                 json=data
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
             
-        except requests.HTTPError as e:
-            logger.error(f"HTTP error in Zoho API request: {str(e)}")
+        except httpx.HTTPStatusError as e:
+            logger.error("HTTP error in Zoho API request: %s", e)
             # Handle specific error codes
-            if response.status_code == 401:
+            if e.response.status_code == 401:
                 # Token might be invalid, try to refresh and retry once
-                self.access_token = None
-                access_token = await self.get_access_token()
+                access_token = await self.get_access_token(rejected_token=access_token)
                 headers["Authorization"] = f"Zoho-oauthtoken {access_token}"
                 
                 # Retry the request
-                response = requests.request(
+                response = await self.client.request(
                     method=method.upper(),
                     url=f"{self.api_url}/crm/v2/{endpoint}",
                     headers=headers,
@@ -108,12 +155,12 @@ class ZohoService:
                     json=data
                 )
                 response.raise_for_status()
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 # Re-raise the exception for other HTTP errors
                 raise
         except Exception as e:
-            logger.error(f"Error in Zoho API request: {str(e)}")
+            logger.error("Error in Zoho API request: %s", e)
             raise
     
     async def get_leads(self, fields: Optional[List[str]] = None, criteria: Optional[str] = None, 
@@ -152,59 +199,72 @@ class ZohoService:
         
         return response.get("data", [])
     
+    async def _fetch_record(
+        self,
+        resource: str,
+        item: Dict[str, Any],
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """
+        Get the full details of a webhook record from Zoho CRM.
+        
+        Falls back to the webhook data if the record can't be fetched.
+        """
+        record_id = item["id"]
+        
+        async with semaphore:
+            try:
+                # Get detailed record from Zoho CRM
+                record_data = await self.make_api_request(
+                    method="GET",
+                    endpoint=f"{resource}/{record_id}"
+                )
+            except Exception as e:
+                logger.error("Error fetching record details from Zoho: %s", e)
+                # Use the data from the webhook as fallback
+                return item
+        
+        # Extract the record from the response
+        if "data" in record_data and len(record_data["data"]) > 0:
+            return record_data["data"][0]
+        
+        logger.warning("Record not found in Zoho CRM: %s/%s", resource, record_id)
+        # Use the data from the webhook as fallback
+        return item
+    
     async def process_webhook(self, payload: WebhookPayload) -> List[Dict[str, Any]]:
         """
         Process webhook payload from Zoho CRM.
         
         This method processes the webhook data and enriches it with additional
-        data if needed before storing it in Supabase.
+        data if needed before storing it in Supabase. Record details are
+        fetched concurrently, with at most MAX_CONCURRENT_FETCHES in flight.
         """
         try:
-            processed_data = []
+            items = []
             
             for item in payload.data:
                 # Get the ID from the webhook data
-                record_id = item.get("id")
-                
-                if not record_id:
-                    logger.warning(f"Record ID not found in webhook data: {item}")
-                    continue
-                
-                # For delete operations, we just need the ID
-                if payload.operation in [
-                    "DELETE", "BULK_DELETE"
-                ]:
-                    processed_data.append({"id": record_id, "deleted": True})
+                if not item.get("id"):
+                    logger.warning("Record ID not found in webhook data: %s", item)
                     continue
-                
-                # For create and update operations, get full record details from Zoho
-                try:
-                    # Get detailed record from Zoho CRM
-                    record_data = await self.make_api_request(
-                        method="GET",
-                        endpoint=f"{payload.resource}/{record_id}"
-                    )
-                    
-                    # Extract the record from the response
-                    if "data" in record_data and len(record_data["data"]) > 0:
-                        full_record = record_data["data"][0]
-                        processed_data.append(full_record)
-                    else:
-                        logger.warning(
-                            f"Record not found in Zoho CRM: {payload.resource}/{record_id}"
-                        )
-                        # Use the data from the webhook as fallback
-                        processed_data.append(item)
-                        
-                except Exception as e:
-                    logger.error(
-                        f"Error fetching record details from Zoho: {str(e)}"
-                    )
-                    # Use the data from the webhook as fallback
-                    processed_data.append(item)
+                items.append(item)
+            
+            # For delete operations, we just need the ID
+            if payload.operation in [
+                "DELETE", "BULK_DELETE"
+            ]:
+                return [{"id": item["id"], "deleted": True} for item in items]
             
-            return processed_data
+            # For create and update operations, get full record details from Zoho
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+            processed_data = await asyncio.gather(*(
+                self._fetch_record(payload.resource, item, semaphore)
+                for item in items
+            ))
+            
+            return list(processed_data)
             
         except Exception as e:
-            logger.error(f"Error processing webhook data: {str(e)}")
-            raise 
\ No newline at end of file
+            logger.error("Error processing webhook data: %s", e)
+            raise
@@ -1,6 +1,7 @@
-import json
 import logging
+import orjson
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 # Configure logging
@@ -23,9 +24,59 @@ def parse_iso_datetime(date_string: str) -> Optional[datetime]:
             # Fallback to standard ISO format
             return datetime.strptime(date_string, "%Y-%m-%dT%H:%M:%S.%fZ")
         except (ValueError, AttributeError):
-            logger.warning(f"Failed to parse date string: {date_string}")
+            logger.warning("Failed to parse date string: %s", date_string)
             return None
 
+@lru_cache(maxsize=1024)
+def _is_date_key(key: str) -> bool:
+    """
+    Check whether a field name looks like a date/time field.
+    
+    Zoho records in a batch share the same field names, so the result
+    is cached per name instead of re-checking every record.
+    """
+    return key.lower().endswith(("date", "time", "at"))
+
+@lru_cache(maxsize=4096)
+def _normalize_datetime_string(value: str) -> str:
+    """
+    Convert a date string to canonical ISO format if it can be parsed.
+    
+    Caches the formatted string so repeated timestamps skip both the
+    parse and the isoformat() call. Unparseable strings are cached too, so
+    the parse failure is only logged the first time a string is seen.
+    """
+    dt = parse_iso_datetime(value)
+    return dt.isoformat() if dt else value
+
+def _transform_dict(transformed: Dict[str, Any], key: str, value: Dict[str, Any]) -> None:
+    """Store a nested object, splitting lookup fields into ID and name."""
+    # Check if it's a lookup field (has 'id' and 'name')
+    if "id" in value and "name" in value:
+        # Store both ID and name for lookup fields
+        transformed[f"{key}_id"] = value["id"]
+        transformed[f"{key}_name"] = value["name"]
+    else:
+        # Store nested object as JSON
+        transformed[key] = orjson.dumps(value).decode()
+
+def _transform_list(transformed: Dict[str, Any], key: str, value: List[Any]) -> None:
+    """Store a list as JSON."""
+    transformed[key] = orjson.dumps(value).decode()
+
+def _transform_str(transformed: Dict[str, Any], key: str, value: str) -> None:
+    """Store a string, normalizing it if it's a date field."""
+    if _is_date_key(key):
+        value = _normalize_datetime_string(value)
+    transformed[key] = value
+
+# Field transforms keyed by the exact value type; other types are copied as-is
+_TRANSFORMS_BY_TYPE = {
+    dict: _transform_dict,
+    list: _transform_list,
+    str: _transform_str,
+}
+
 def transform_zoho_to_supabase(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Transform Zoho CRM data format to Supabase format.
@@ -52,32 +103,9 @@ def transform_zoho_to_supabase(data: Dict[str, Any]) -> Dict[str, Any]:
         if key == "id":
             continue
         
-        # Handle nested objects
-        if isinstance(value, dict):
-            # Check if it's a lookup field (has 'id' and 'name')
-            if "id" in value and "name" in value:
-                # Store both ID and name for lookup fields
-                transformed[f"{key}_id"] = value["id"]
-                transformed[f"{key}_name"] = value["name"]
-            else:
-                # Store nested object as JSON
-                transformed[key] = json.dumps(value)
-        
-        # Handle lists
-        elif isinstance(value, list):
-            # Store lists as JSON
-            transformed[key] = json.dumps(value)
-        
-        # Handle date fields
-        elif key.lower().endswith(("date", "time", "at")) and isinstance(value, str):
-            # Convert to datetime if possible
-            dt = parse_iso_datetime(value)
-            if dt:
-                transformed[key] = dt.isoformat()
-            else:
-                transformed[key] = value
-        
-        # Handle other fields
+        transform = _TRANSFORMS_BY_TYPE.get(type(value))
+        if transform:
+            transform(transformed, key, value)
         else:
             transformed[key] = value
     
@@ -95,4 +123,4 @@ def transform_batch_data(
     Returns:
         List of transformed records for Supabase
     """
-    return [transform_zoho_to_supabase(record) for record in data] 
\ No newline at end of file
+    return list(map(transform_zoho_to_supabase, data)) 
\ No newline at end of file
@@ -1,4 +1,7 @@
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Your Zoho client credentials
 client_id = "1000.UNB58ZS0C379RPF1XNZTQN1WR53VOA"
@@ -19,8 +22,21 @@ params = {
 }
 
 try:
-    response = requests.post(token_url, params=params)
-    tokens = response.json()
+    with requests.Session() as session:
+        session.headers.update({"Accept": "application/json"})
+        session.mount("https://", HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+        ))
+        with session.post(token_url, data=params, timeout=(5, 15)) as response:
+            try:
+                response.raise_for_status()
+            except requests.HTTPError:
+                # Show Zoho's error details before reporting the status
+                print(f"\nResponse from Zoho: {response.text}")
+                raise
+            tokens = orjson.loads(response.content)
     
     print(f"\nResponse from Zoho: {tokens}")
     
@@ -1,12 +1,40 @@
+import os
+import sys
+import time
+import orjson
 import requests
+from pathlib import Path
+from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Your Zoho client credentials from .env
 client_id = "1000.UNB58ZS0C379RPF1XNZTQN1WR53VOA"
 client_secret = "ed1831881558014810e42f3aa6f85ee85c0500008b"
 redirect_uri = "http://localhost:8000/api/auth/callback"
 
+# Refresh tokens from earlier runs are cached here and reused until they age out.
+# The cache lives in the home directory so it never ends up in a Docker build context.
+token_cache = Path.home() / ".zoho_refresh_token.json"
+token_max_age = 89 * 24 * 60 * 60
+
+try:
+    cached = orjson.loads(token_cache.read_bytes())
+    if time.time() - cached["obtained_at"] < token_max_age:
+        print(f"Your refresh token is: {cached['refresh_token']}")
+        print(f"(cached in {token_cache}; delete it to generate a new one)")
+        sys.exit(0)
+except (OSError, ValueError, KeyError, TypeError):
+    pass
+
 # Step 1: Generate authorization URL
-auth_url = f"https://accounts.zoho.com/oauth/v2/auth?scope=ZohoCRM.modules.ALL,ZohoCRM.settings.ALL&client_id={client_id}&response_type=code&access_type=offline&redirect_uri={redirect_uri}"
+auth_url = "https://accounts.zoho.com/oauth/v2/auth?" + urlencode({
+    "scope": "ZohoCRM.modules.ALL,ZohoCRM.settings.ALL",
+    "client_id": client_id,
+    "response_type": "code",
+    "access_type": "offline",
+    "redirect_uri": redirect_uri
+}, safe=",")
 
 print(f"Visit this URL in your browser to authorize:\n{auth_url}")
 
@@ -23,9 +51,33 @@ params = {
     "redirect_uri": redirect_uri
 }
 
-response = requests.post(token_url, params=params)
-tokens = response.json()
+with requests.Session() as session:
+    session.headers.update({"Accept": "application/json"})
+    session.mount("https://", HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+    ))
+    with session.post(token_url, data=params, timeout=(5, 15)) as response:
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            # Show Zoho's error details along with the status
+            print(f"\nError: {e}")
+            print(f"Response from Zoho: {response.text}")
+            sys.exit(1)
+        tokens = orjson.loads(response.content)
 
 print(f"\nResponse from Zoho: {tokens}")
 print(f"\nYour refresh token is: {tokens.get('refresh_token')}")
-print("Add this to your .env file as ZOHO_REFRESH_TOKEN") 
\ No newline at end of file
+print("Add this to your .env file as ZOHO_REFRESH_TOKEN")
+
+# Cache the refresh token so reruns don't need a new authorization
+if tokens.get("refresh_token"):
+    # Restrict permissions before the token is written
+    token_cache.touch(mode=0o600)
+    os.chmod(token_cache, 0o600)
+    token_cache.write_bytes(orjson.dumps({
+        "refresh_token": tokens["refresh_token"],
+        "obtained_at": time.time()
+    }))
@@ -0,0 +1,103 @@
+from types import SimpleNamespace
+import pytest
+from app.services.supabase import SupabaseService
+
+
+class FakeQuery:
+    """Records the Supabase query builder calls made by SupabaseService."""
+
+    def __init__(self, calls, table):
+        self.calls = calls
+        self.table = table
+        self.operation = None
+
+    def delete(self):
+        self.operation = "delete"
+        return self
+
+    def in_(self, column, values):
+        self.args = (column, values)
+        return self
+
+    def upsert(self, records):
+        self.operation = "upsert"
+        self.args = records
+        return self
+
+    def execute(self):
+        self.calls.append((self.operation, self.table, self.args))
+        if self.operation == "upsert":
+            return SimpleNamespace(data=self.args)
+        return SimpleNamespace(data=[])
+
+
+@pytest.fixture
+def service():
+    """Supabase service backed by a fake client that records its calls."""
+    service = SupabaseService()
+    service.calls = []
+    service.client = SimpleNamespace(table=lambda table: FakeQuery(service.calls, table))
+    return service
+
+
+@pytest.mark.asyncio
+async def test_store_data_upserts_records(service):
+    records = [{"id": "1", "name": "a"}, {"id": "2", "name": "b"}]
+
+    result = await service.store_data("leads", records)
+
+    assert result == {"success": True, "data": records}
+    assert service.calls == [("upsert", "leads", records)]
+
+
+@pytest.mark.asyncio
+async def test_store_data_deletes_records(service):
+    records = [{"id": "1", "deleted": True}, {"id": "2", "deleted": True}]
+
+    result = await service.store_data("leads", records)
+
+    assert result == {"success": True, "data": {"deleted": 2}}
+    assert service.calls == [("delete", "leads", ("id", ["1", "2"]))]
+
+
+@pytest.mark.asyncio
+async def test_store_data_splits_mixed_batches(service):
+    # The first record no longer decides the operation for the whole batch
+    records = [{"id": "1", "name": "a"}, {"id": "2", "deleted": True}]
+
+    result = await service.store_data("leads", records)
+
+    assert result == {
+        "success": True,
+        "data": {"deleted": 1, "upserted": [{"id": "1", "name": "a"}]}
+    }
+    assert sorted(service.calls) == [
+        ("delete", "leads", ("id", ["2"])),
+        ("upsert", "leads", [{"id": "1", "name": "a"}]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_store_data_does_not_upsert_deleted_records(service):
+    records = [{"id": "1", "name": "a"}, {"id": "1", "deleted": True}]
+
+    result = await service.store_data("leads", records)
+
+    assert result == {"success": True, "data": {"deleted": 1}}
+    assert service.calls == [("delete", "leads", ("id", ["1"]))]
+
+
+@pytest.mark.asyncio
+async def test_store_data_skips_deletions_without_ids(service):
+    result = await service.store_data("leads", [{"deleted": True}])
+
+    assert result == {"success": True, "data": None}
+    assert service.calls == []
+
+
+@pytest.mark.asyncio
+async def test_store_data_skips_empty_input(service):
+    result = await service.store_data("leads", [])
+
+    assert result == {"success": True, "data": None}
+    assert service.calls == []
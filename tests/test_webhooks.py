@@ -0,0 +1,116 @@
+import hmac
+import json
+import hashlib
+import pytest
+from fastapi.testclient import TestClient
+from app.api import webhooks
+from app.main import app
+
+SECRET = b"test-webhook-secret"
+
+PAYLOAD = (
+    b'{"operation": "CREATE", "resource": "Leads", '
+    b'"triggered_at": "2023-08-01T10:00:00Z", "data": [{"id": "1"}]}'
+)
+
+
+def use_secret(monkeypatch, secret: bytes) -> None:
+    """Point the webhook signature check at the given secret."""
+    inner, outer = webhooks._hmac_sha256_contexts(secret)
+    monkeypatch.setattr(webhooks, "_WEBHOOK_INNER", inner)
+    monkeypatch.setattr(webhooks, "_WEBHOOK_OUTER", outer)
+
+
+def sign(body: bytes, secret: bytes = SECRET) -> str:
+    """Sign a webhook body the way Zoho CRM does."""
+    return hmac.new(secret, body, hashlib.sha256).hexdigest()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Test client with a known webhook secret and no calls to Zoho or Supabase."""
+    use_secret(monkeypatch, SECRET)
+
+    async def process_webhook(payload):
+        return payload.data
+
+    async def store_data(table, data):
+        return {"success": True, "data": data}
+
+    monkeypatch.setattr(webhooks.zoho_service, "process_webhook", process_webhook)
+    monkeypatch.setattr(webhooks.supabase_service, "store_data", store_data)
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("secret", [b"", b"short", b"k" * 64, b"k" * 65, b"k" * 200])
+@pytest.mark.parametrize("body", [b"", PAYLOAD])
+def test_webhook_digest_matches_hmac(monkeypatch, secret, body):
+    use_secret(monkeypatch, secret)
+
+    assert webhooks._webhook_digest(body) == hmac.new(secret, body, hashlib.sha256).digest()
+
+
+def test_signed_webhook_is_accepted(client):
+    response = client.post(
+        "/api/webhooks/zoho",
+        content=PAYLOAD,
+        headers={"X-Zoho-Signature": sign(PAYLOAD)}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "success"
+
+
+def test_wrong_signature_is_rejected(client):
+    response = client.post(
+        "/api/webhooks/zoho",
+        content=PAYLOAD,
+        headers={"X-Zoho-Signature": sign(PAYLOAD, b"other-secret")}
+    )
+
+    assert response.status_code == 401
+
+
+def test_uppercase_signature_is_accepted(client):
+    # Signatures are compared as raw bytes, so the hex case doesn't matter
+    response = client.post(
+        "/api/webhooks/zoho",
+        content=PAYLOAD,
+        headers={"X-Zoho-Signature": sign(PAYLOAD).upper()}
+    )
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("signature", ["", "not-hex", "abc", sign(PAYLOAD)[:-1] + "z"])
+def test_non_hex_signature_is_rejected(client, signature):
+    response = client.post(
+        "/api/webhooks/zoho",
+        content=PAYLOAD,
+        headers={"X-Zoho-Signature": signature}
+    )
+
+    assert response.status_code == 401
+
+
+def test_invalid_payload_errors_are_reported_against_the_body(client):
+    body = b'{"operation": "UNKNOWN", "resource": "Leads"}'
+
+    response = client.post(
+        "/api/webhooks/zoho",
+        content=body,
+        headers={"X-Zoho-Signature": sign(body)}
+    )
+
+    assert response.status_code == 422
+    errors = response.json()["detail"]
+    assert errors
+    assert all(error["loc"][0] == "body" for error in errors)
+
+
+def test_openapi_declares_the_webhook_request_body():
+    operation = app.openapi()["paths"]["/api/webhooks/zoho"]["post"]
+
+    schema = operation["requestBody"]["content"]["application/json"]["schema"]
+    assert set(schema["required"]) >= {"operation", "resource", "triggered_at", "data"}
+    assert "#/$defs/" not in json.dumps(operation)
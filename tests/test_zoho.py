@@ -0,0 +1,58 @@
+import asyncio
+import time
+import httpx
+import orjson
+import pytest
+from app.services.zoho import ZohoService
+
+
+class FakeZohoClient:
+    """Stands in for httpx.AsyncClient, issuing tokens and rejecting revoked ones."""
+
+    def __init__(self):
+        self.refreshes = 0
+        self.revoked = set()
+
+    async def post(self, url, data=None):
+        self.refreshes += 1
+        # Let other waiting requests run while the refresh is in flight
+        await asyncio.sleep(0.01)
+        body = {"access_token": f"token-{self.refreshes}", "expires_in": 3600}
+        return httpx.Response(200, content=orjson.dumps(body), request=httpx.Request("POST", url))
+
+    async def request(self, method, url, headers=None, params=None, json=None):
+        await asyncio.sleep(0)
+        token = headers["Authorization"].split()[-1]
+        status_code = 401 if token in self.revoked else 200
+        return httpx.Response(status_code, content=b'{"data": []}', request=httpx.Request(method, url))
+
+
+@pytest.fixture
+def service():
+    """Zoho service backed by a fake HTTP client."""
+    service = ZohoService()
+    service._client = FakeZohoClient()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_concurrent_401s_refresh_the_token_once(service):
+    assert await service.get_access_token() == "token-1"
+    service._client.revoked.add("token-1")
+
+    results = await asyncio.gather(*(
+        service.make_api_request("GET", "Leads/1") for _ in range(20)
+    ))
+
+    assert results == [{"data": []}] * 20
+    assert service._client.refreshes == 2
+    assert service.access_token == "token-2"
+
+
+@pytest.mark.asyncio
+async def test_401_from_a_replaced_token_does_not_refresh(service):
+    service.access_token = "token-2"
+    service.token_expiry = int(time.time()) + 3600
+
+    assert await service.get_access_token(rejected_token="token-1") == "token-2"
+    assert service._client.refreshes == 0